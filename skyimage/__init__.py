@@ -12,8 +12,13 @@ if not sys.warnoptions:
 
     warnings.simplefilter("default")
 
-reload(logging)
-logging.basicConfig(filename="logger.log", level=logging.INFO)
+# basicConfig is a no-op once the root logger has handlers (IPython,
+# pytest, host apps), so replace them to keep writing `logger.log`
+if sys.version_info >= (3, 8):
+    logging.basicConfig(filename="logger.log", level=logging.INFO, force=True)
+else:
+    reload(logging)
+    logging.basicConfig(filename="logger.log", level=logging.INFO)
 
 rich_trace()
 
@@ -1,16 +1,11 @@
-from datetime import date
 from datetime import datetime
 from typing import List
 from typing import Optional
 from typing import Union
 
-from matplotlib.pyplot import savefig
-import pandas as pd
-
 from skyimage.stations.Ground.GroundControl import GroundControl
 from skyimage.stations.Sky.SkyControl import SkyControl
 from skyimage.utils.utils import Station as StationObject
-from skyimage.utils.utils import buffer_value
 from skyimage.utils.validators import validate_datetime
 from skyimage.utils.validators import validate_file_path
 
@@ -73,34 +68,30 @@ class SkyImage:
         # create datetime objects asap
         # app return j_day and j_day_full properties
         _, self.stds = validate_datetime(j_day, year)
-        stds_dict: dict = {}
-        for std in self.stds:
-            j_day = buffer_value(std.timetuple().tm_yday, 3)
-            stds_dict[str(std.year) + j_day] = std
+        stds_dict: dict = {f"{std:%Y%j}": std for std in self.stds}
 
         self.stds = stds_dict
+        # stds keys are year + julian day, derive day lists once
+        self._j_days_full: List[str] = list(self.stds.keys())
+        self._j_days: List[str] = [key[-3:] for key in self._j_days_full]
+
         self.save_images: bool = save_images
         self.show_images: bool = show_images
         self.show_time_stats: bool = show_time_stats
 
     @property
     def j_days(self) -> List[str]:
-        j_days: list = []
-        for target in self.stds.values():
-            j_day = target.timetuple().tm_yday
-            j_days.append(buffer_value(j_day, 3))
-        return j_days
+        return self._j_days
 
     @property
     def j_days_full(self, abbrev: bool = False) -> List[str]:
 
-        return list(self.stds.keys())
+        return self._j_days_full
 
     @property
     def j_days_abrev(self) -> str:
-        j_days: list = list(self.stds.keys())
-        first: str = j_days[0]
-        last: str = j_days[-1]
+        first: str = self._j_days_full[0]
+        last: str = self._j_days_full[-1]
 
         return f"{first}-{last}"
 
@@ -147,21 +138,23 @@ class SkyImage:
                 "GroundControl object required, no GroundImage objects present"
             )
 
-        if save and not as_dataframe:
-            as_dataframe = True
+        # saving requires a dataframe
+        if not as_dataframe and not save:
+            return {
+                "SKY": self.sky.results(as_dataframe=False),
+                "GROUND": self.ground.results(as_dataframe=False),
+            }
 
-        sky_results: dict = self.sky.results(as_dataframe=False)
-        ground_results: dict = self.ground.results(as_dataframe=False)
+        import pandas as pd
 
-        if not as_dataframe:
-            return {"SKY": sky_results, "GROUND": ground_results}
-
-        sky_df = pd.DataFrame.from_dict(sky_results, orient="index").add_prefix("sky_")
-        ground_df = pd.DataFrame.from_dict(ground_results, orient="index").add_prefix(
-            "grnd_"
-        )
+        # same frames as the controls return, BI / SI stats
+        # flattened into grnd_BI_mean, grnd_BI_max, ... columns
+        sky_df = self.sky.results(as_dataframe=True).add_prefix("sky_")
+        ground_df = self.ground.results(as_dataframe=True).add_prefix("grnd_")
 
-        combined_df = pd.merge(sky_df, ground_df, left_index=True, right_index=True)
+        # both frames are keyed by year + julian day,
+        # align on the index without a merge join
+        combined_df = pd.concat([sky_df, ground_df], axis=1, join="inner")
 
         if save:
             combined_df.to_csv(f"SkyImage_Results_{self.j_days_abrev}.csv")
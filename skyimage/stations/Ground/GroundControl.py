@@ -1,20 +1,26 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import os
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import TYPE_CHECKING
 from typing import Union
 import warnings
 
-import matplotlib.pyplot as plt
 import numpy as np
-import pandas as pd
-from rich.progress import track
 from skyimage.stations.Ground.GroundImage import GroundImage
+from skyimage.stations.Ground.utils.image import BI_SI_RANGE
+from skyimage.stations.Ground.utils.image import X_STEP
+from skyimage.stations.Ground.utils.image import Y_STEP
+from skyimage.stations.Ground.utils.image import histogram_BI_SI
 from skyimage.utils.utils import Station as StationObject
-from skyimage.utils.utils import buffer_value
 from skyimage.utils.validators import validate_datetime
 from skyimage.utils.validators import validate_file_path
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class GroundControl:
     """
@@ -104,14 +110,12 @@ class GroundControl:
                 target_time = "12:00"
 
             _, self.stds = validate_datetime(j_day, year)
-            hour, minute = target_time.split(":")
+            hour, minute = [int(x) for x in target_time.split(":")]
 
-            stds_dict: dict = {}
-            for std in self.stds:
-                j_day = buffer_value(std.timetuple().tm_yday, 3)
-                stds_dict[str(std.year) + j_day] = std.replace(
-                    hour=int(hour), minute=int(minute)
-                )
+            stds_dict: dict = {
+                f"{std:%Y%j}": std.replace(hour=hour, minute=minute)
+                for std in self.stds
+            }
 
             self.stds = stds_dict
 
@@ -145,11 +149,8 @@ class GroundControl:
 
     @property
     def j_days(self) -> List[str]:
-        j_days: list = []
-        for target in self.stds.values():
-            j_day = target.timetuple().tm_yday
-            j_days.append(buffer_value(j_day, 3))
-        return j_days
+        # stds keys are already year + padded julian day
+        return [key[-3:] for key in self.stds.keys()]
 
     @property
     def j_days_full(self) -> List[str]:
@@ -182,10 +183,9 @@ class GroundControl:
         `matching_images` : Dict[str, `GroundImage`]
 
         """
-        matching_images: dict = {}
-        for k, std in self.stds.items():
 
-            img_obj = GroundImage(
+        def make_image_object(std: datetime) -> GroundImage:
+            return GroundImage(
                 ground_path=self.path,
                 station=self.station,
                 target_time=std,
@@ -193,11 +193,17 @@ class GroundControl:
                 save_image=self.save_images,
             )
 
-            matching_images[k] = img_obj
+        # image searches are I/O bound, overlap them across threads
+        n_workers: int = max(1, min(32, len(self.stds)))
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            img_objs = executor.map(make_image_object, self.stds.values())
+            matching_images: dict = dict(zip(self.stds.keys(), img_objs))
 
         return matching_images
 
-    def run_all(self, show_time: bool = False) -> None:
+    def run_all(
+        self, show_time: bool = False, n_workers: Optional[int] = None
+    ) -> None:
         """Run all found GroundImage objects
 
         Parameters
@@ -205,21 +211,42 @@ class GroundControl:
         show_time : bool
             show time statistics
 
+        n_workers : int, optional
+            number of images processed at once, defaults to cpu count,
+            1 runs serially for debugging
+
         """
-        start = datetime.now()
-        for ground_obj in track(self.images.values(), description="Ground Images"):
+        from rich.progress import track
 
-            if not isinstance(ground_obj, GroundImage):
-                raise ValueError("Iterable must be type `GroundImage`")
+        start = datetime.now()
 
+        # `self.images` only ever holds `GroundImage` objects
+        def run_image_object(ground_obj: GroundImage) -> None:
             ground_obj.run_all(show_time=show_time)
 
+        if not n_workers:
+            n_workers = os.cpu_count() or 1
+
+        if n_workers == 1 or self.show_images or self.save_images:
+            # pyplot is not thread-safe
+            for ground_obj in track(self.images.values(), description="Ground Images"):
+                run_image_object(ground_obj)
+        else:
+            # image decoding and numpy release the GIL,
+            # one image in flight per core bounds memory use
+            with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                completed = executor.map(run_image_object, self.images.values())
+                for _ in track(
+                    completed, total=len(self.images), description="Ground Images"
+                ):
+                    pass
+
         if show_time:
             print("GroundImage Done-", datetime.now() - start)
 
     def results(
         self, as_dataframe: Optional[bool] = False
-    ) -> Union[dict, pd.DataFrame]:
+    ) -> Union[dict, "pd.DataFrame"]:
         """Get processed results from all GroundImage objects
 
         Parameters
@@ -233,21 +260,28 @@ class GroundControl:
             all results as Dict
 
         """
-        all_results: dict = {}
+        names: list = []
+        records: list = []
 
         for ground_obj in self.images.values():
+            names.append(ground_obj.j_day_full)
+            records.append(ground_obj.results())
 
-            if not isinstance(ground_obj, GroundImage):
-                raise ValueError("Iterable must be type `GroundImage`")
+        if as_dataframe:
+            import pandas as pd
 
-            name = ground_obj.j_day_full
-            results = ground_obj.results()
-            all_results[name] = results
+            # unnest BI / SI stats into BI_mean, BI_max, ... columns
+            flat_records: list = []
+            for record in records:
+                flat_record: dict = dict(record)
+                for index in ("BI", "SI"):
+                    for stat, value in flat_record.pop(index).items():
+                        flat_record[f"{index}_{stat}"] = value
+                flat_records.append(flat_record)
 
-        if as_dataframe:
-            return pd.DataFrame.from_dict(all_results, orient="index")
+            return pd.DataFrame.from_records(flat_records, index=names)
 
-        return all_results
+        return dict(zip(names, records))
 
     @staticmethod
     def show_graph(
@@ -257,6 +291,7 @@ class GroundControl:
         save: Optional[bool] = None,
         file_name: Optional[str] = None,
     ):
+        import matplotlib.pyplot as plt
 
         if poi:
             BI = poi["BI"]
@@ -264,29 +299,32 @@ class GroundControl:
         elif not BI and not SI:
             raise TypeError("Require poi Dict ['BI' : array, 'SI': array ] or BI / SI")
 
-        BI = BI.flatten()
-        SI = SI.flatten()
+        BI = BI.ravel()
+        SI = SI.ravel()
+
+        # keep only points valid in both so x / y stay paired
+        valid = np.logical_not(np.isnan(BI) | np.isnan(SI))
+        x = BI[valid]
+        y = SI[valid]
 
-        x = BI[np.logical_not(np.isnan(BI))]
-        y = SI[np.logical_not(np.isnan(SI))]
+        # own figure per graph, so saving can close exactly it
+        fig, ax = plt.subplots()
 
-        plt.xlabel("BI")
-        plt.ylabel("SI")
+        ax.set_xlabel("BI")
+        ax.set_ylabel("SI")
 
-        plt.hist2d(x, y, (50, 50), cmap=plt.cm.jet)
+        hist = ax.imshow(
+            histogram_BI_SI(x, y, 50).T,
+            origin="lower",
+            extent=(*BI_SI_RANGE[0], *BI_SI_RANGE[1]),
+            aspect="auto",
+            cmap=plt.cm.jet,
+        )
 
-        x_step = [0, 0.1, 0.35, 0.7, 0.8, 1]
-        y_step = [1, 0.6, 0.35, 0.15, 0.1, 0]
-        plt.plot(x_step, y_step, "w")
+        ax.plot(X_STEP, Y_STEP, "w")
 
-        cb = plt.colorbar()
+        fig.colorbar(hist, ax=ax)
 
         if save:
-            plt.savefig(file_name, dpi=100)
-            # TODO fix
-            # one of these works
-            cb.remove()
-            plt.close()
-            plt.close("all")
-            plt.clf()
-            plt.cla()
+            fig.savefig(file_name, dpi=100)
+            plt.close(fig)
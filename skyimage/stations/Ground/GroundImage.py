@@ -1,21 +1,35 @@
 from datetime import datetime
-import glob
 import logging
+from operator import itemgetter
+import os
+import re
 from typing import Dict
 from typing import Optional
+from typing import TYPE_CHECKING
 from typing import Union
 import warnings
 
-import matplotlib.pyplot as plt
 import numpy as np
 from numpy import ndarray
-import pandas as pd
-from skimage.io import imread
-from skyimage.stations.Ground.utils.image import f_above_or_below
+from PIL import Image
+from PIL import ImageOps
+from skyimage.stations.Ground.utils.image import BI_SI_RANGE
+from skyimage.stations.Ground.utils.image import BOUNDARY
+from skyimage.stations.Ground.utils.image import X_STEP
+from skyimage.stations.Ground.utils.image import Y_STEP
+from skyimage.stations.Ground.utils.image import calc_SI_BI
+from skyimage.stations.Ground.utils.image import f_above_or_below_all
+from skyimage.stations.Ground.utils.image import histogram_BI_SI
+from skyimage.stations.Ground.utils.image import open_mask
 from skyimage.stations.Ground.utils.utils import STDDelta
 from skyimage.stations.Sky import SkyScene
 from skyimage.utils.utils import Station as StationObject
-from skyimage.utils.utils import buffer_value
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+CAPTURE_TIME_PATTERN = re.compile(r"(\d{8})T(\d{2})(\d{2})(\d{2})")
 
 
 class GroundImage:
@@ -71,6 +85,7 @@ class GroundImage:
 
         self.BI: ndarray
         self.SI: ndarray
+        self.BI_valid: ndarray
         self.BI_stats: dict
         self.SI_stats: dict
         self.n_total: int
@@ -78,14 +93,11 @@ class GroundImage:
 
     @property
     def j_day(self) -> str:
-        j_day: int = self.target_time.timetuple().tm_yday
-        return buffer_value(j_day, 3)
+        return f"{self.target_time:%j}"
 
     @property
     def j_day_full(self) -> str:
-        j_day: int = self.target_time.timetuple().tm_yday
-        year: int = self.target_time.year
-        return str(year) + buffer_value(j_day, 3)
+        return f"{self.target_time:%Y%j}"
 
     @property
     def name(self) -> str:
@@ -128,13 +140,16 @@ class GroundImage:
 
     @staticmethod
     def __show_image(img: ndarray) -> None:
+        import matplotlib.pyplot as plt
+
         plt.imshow(img)
         plt.show()
 
     @staticmethod
     def __save_image(img: ndarray, file_name: str) -> None:
+        import matplotlib.pyplot as plt
 
-        plt.imsave(file_name, img.astype("uint8"))
+        plt.imsave(file_name, img.astype(np.uint8, copy=False))
 
     def __find_matching_image(
         self, target_time: datetime, station: str, path: str
@@ -172,28 +187,53 @@ class GroundImage:
 
         """
         file_format: str = self.file_format
-        year: str = str(target_time.year)
-        month: str = buffer_value(target_time.month, 2)
-        day: str = buffer_value(target_time.day, 2)
-
-        search_directory: str = f"/{station}/{year}/{month}/{day}/"
-
-        matching_file_list = list(
-            glob.iglob(path + f"{search_directory}*{year + month + day}*.{file_format}")
+        search_directory: str = f"/{station}/{target_time:%Y/%m/%d}/"
+        date_stamp: str = f"{target_time:%Y%m%d}"
+        extension: str = f".{file_format}"
+
+        # images share the target's day, so `timedelta.seconds` of
+        # capture - target is the seconds-of-day difference mod 86400
+        target_seconds: int = (
+            target_time.hour * 3600
+            + target_time.minute * 60
+            + target_time.second
+            + (target_time.microsecond > 0)
         )
 
+        # (seconds delta, path, YYYYMMDDTHHMMSS capture time) of images
+        # from `target_time` day
+        matching_file_list: list = []
+        try:
+            with os.scandir(path + search_directory) as entries:
+                for entry in entries:
+                    # glob skipped dotfiles (e.g. AppleDouble `._` files),
+                    # d_type from readdir, no extra stat call
+                    if (
+                        entry.name.startswith(".")
+                        or not entry.name.endswith(extension)
+                        or not entry.is_file()
+                    ):
+                        continue
+
+                    capture_time = CAPTURE_TIME_PATTERN.search(entry.name)
+                    if capture_time and capture_time.group(1) == date_stamp:
+                        hour, minute, second = map(int, capture_time.group(2, 3, 4))
+                        seconds_delta: int = (
+                            hour * 3600 + minute * 60 + second - target_seconds
+                        ) % 86400
+                        matching_file_list.append(
+                            (seconds_delta, entry.path, capture_time.group(0))
+                        )
+        except FileNotFoundError:
+            pass
+
         if not matching_file_list:
             raise FileNotFoundError(f"GROUND image for {target_time} not found")
 
-        time_resolver: STDDelta = STDDelta()
-        for file in matching_file_list:
-            ground_std_idx: int = file.index(year + month + day)
-            ground_std = datetime.strptime(
-                file[ground_std_idx : ground_std_idx + 15], "%Y%m%dT%H%M%S"
-            )
-            std_delta = ground_std - target_time
-            seconds_delta: int = std_delta.seconds
-            time_resolver.min_resolver(ground_std, seconds_delta, file)
+        # first smallest delta wins, only the chosen stamp is parsed
+        seconds_delta, file, capture_time = min(matching_file_list, key=itemgetter(0))
+        ground_std = datetime.strptime(capture_time, "%Y%m%dT%H%M%S")
+        time_resolver: STDDelta = STDDelta(ground_std, seconds_delta, file)
 
         if time_resolver.seconds > 7200:
             warnings.warn(
@@ -206,12 +246,15 @@ class GroundImage:
                 stacklevel=2,
             )
 
+        # lazy %-formatting, skipped entirely when INFO is disabled
         logging.info(
-            f"""
+            """
             GROUND photo
-            {time_resolver}
-            target: {str(target_time)}
+            %s
+            target: %s
             """,
+            time_resolver,
+            target_time,
         )
         self.direct_path = time_resolver.path
         self.actual_time = time_resolver.std
@@ -263,34 +306,33 @@ class GroundImage:
         Defines
         ----------
         `self.BI`
-            Brightness Index of image
+            Brightness Index of image,
+            cropped to crop mask bounds
         `self.SI`
-            Sky Index of image
+            Sky Index of image,
+            cropped to crop mask bounds
 
         """
 
-        crop_mask: ndarray = np.load(self.mask_path)
+        crop_mask: ndarray = open_mask(self.mask_path)
 
-        img_arr: ndarray = imread(self.direct_path)
+        # decode with Pillow directly, skipping skimage's plugin dispatch,
+        # EXIF orientation applied as imageio's reader did
+        with Image.open(self.direct_path) as img_file:
+            img_arr: ndarray = np.asarray(ImageOps.exif_transpose(img_file))
 
-        img: ndarray = img_arr * crop_mask
+        if self.show_image or self.save_image:
+            # stay in uint8, the masked image is only for display
+            img: ndarray = np.where(crop_mask, img_arr, np.uint8(0))
 
-        if self.show_image:
-            self.__show_image(img)
+            if self.show_image:
+                self.__show_image(img)
 
-        if self.save_image:
-            img_file_name = self.name + ".png"
-            self.__save_image(img, img_file_name)
+            if self.save_image:
+                img_file_name = self.name + ".png"
+                self.__save_image(img, img_file_name)
 
-        img: ndarray = img.astype("float")
-        img[img == 0] = np.nan
-
-        R: ndarray = img[:, :, 0] / 255
-        G: ndarray = img[:, :, 1] / 255
-        B: ndarray = img[:, :, 2] / 255
-
-        SI: ndarray = (B - R) / (B + R)
-        BI: ndarray = (R + G + B) / 3
+        SI, BI = calc_SI_BI(img_arr, crop_mask)
 
         self.BI = BI
         self.SI = SI
@@ -308,6 +350,9 @@ class GroundImage:
 
         Defines
         ----------
+        `self.BI_valid` : ndarray
+            Pixels with a valid BI and SI
+
         `self.BI_stats` : dict
             Statistical information
             concerning image
@@ -328,11 +373,16 @@ class GroundImage:
 
         """
 
-        def __extract_stats(array) -> Dict[str, float]:
+        def __extract_stats(values) -> Dict[str, float]:
 
-            mean = round(np.nanmean(array), 2)
-            max = round(np.nanmax(array), 2)
-            min = round(np.nanmin(array), 2)
+            if not values.size:
+                return {"mean": np.nan, "max": np.nan, "min": np.nan}
+
+            # accumulate the mean in float64 over float32 values,
+            # round as python floats
+            mean = round(float(values.mean(dtype=np.float64)), 2)
+            max = round(float(values.max()), 2)
+            min = round(float(values.min()), 2)
 
             return {"mean": mean, "max": max, "min": min}
 
@@ -346,26 +396,20 @@ class GroundImage:
         # BI = BI[np.logical_not(np.isnan(BI))]
         # SI = SI[np.logical_not(np.isnan(SI))]
 
-        BI_stats: dict = __extract_stats(self.BI)
-        SI_stats: dict = __extract_stats(self.SI)
-        BI_SI_points = np.column_stack((self.BI.flatten(), self.SI.flatten()))
-
-        x_step = [0, 0.1, 0.35, 0.7, 0.8, 1]
-        y_step = [1, 0.6, 0.35, 0.15, 0.1, 0]
-        boundary = np.column_stack((x_step, y_step))
+        # a valid BI implies a valid SI, so this mask also
+        # pairs BI / SI points for `graph`
+        self.BI_valid = np.logical_not(np.isnan(self.BI))
 
-        pixel_total: int = BI_SI_points[np.logical_not(np.isnan(BI_SI_points))].size / 2
+        # stats over NaN-free values, skips NaN handling in the reductions
+        BI_stats: dict = __extract_stats(self.BI[self.BI_valid])
+        SI_stats: dict = __extract_stats(self.SI[np.logical_not(np.isnan(self.SI))])
 
-        cloud_mask: list = []
-        img_shape: tuple = self.BI.shape[0:2]
-        number_clear: int = 0
+        pixel_total: int = int(np.count_nonzero(self.BI_valid))
 
-        for point in BI_SI_points:
-            results: int = f_above_or_below(point, boundary)
-            cloud_mask.append(results)
-            number_clear = number_clear + results
-
-        cloud_mask = np.array(cloud_mask).reshape(img_shape)
+        cloud_mask: ndarray = f_above_or_below_all(self.BI, self.SI, BOUNDARY)
+        # classifier marks NaN BI / valid SI as clear, count clear
+        # pixels over the same BI-valid set as `pixel_total`
+        number_clear: int = int(np.count_nonzero(cloud_mask.view(bool) & self.BI_valid))
 
         if self.show_image:
             self.__show_image(cloud_mask)
@@ -381,11 +425,11 @@ class GroundImage:
 
         self.BI_stats = BI_stats
         self.SI_stats = SI_stats
-        self.n_total = int(pixel_total)
+        self.n_total = pixel_total
         self.prcnt_cld = percent_cloud
         self.processed = True
 
-    def results(self, as_dataframe: bool = False) -> Union[dict, pd.DataFrame]:
+    def results(self, as_dataframe: bool = False) -> Union[dict, "pd.DataFrame"]:
 
         if not self.processed:
             raise AssertionError("Object not processed")
@@ -400,38 +444,45 @@ class GroundImage:
         }
 
         if as_dataframe:
+            import pandas as pd
+
             return pd.DataFrame.from_dict(results, orient="index")
 
         return results
 
     def graph(self, save: Optional[bool] = False):
+        import matplotlib.pyplot as plt
 
         if not hasattr(self, "BI") or not hasattr(self, "SI"):
             raise ValueError("GroundImage object must have `BI` and `SI` values")
 
-        BI: ndarray = self.BI.flatten()
-        SI: ndarray = self.SI.flatten()
+        # keep only points valid in both so x / y stay paired
+        if hasattr(self, "BI_valid"):
+            valid: ndarray = self.BI_valid
+        else:
+            valid = np.logical_not(np.isnan(self.BI) | np.isnan(self.SI))
 
-        x: ndarray = BI[np.logical_not(np.isnan(BI))]
-        y: ndarray = SI[np.logical_not(np.isnan(SI))]
+        x: ndarray = self.BI[valid]
+        y: ndarray = self.SI[valid]
 
-        plt.xlabel("BI")
-        plt.ylabel("SI")
+        # own figure per graph, so saving can close exactly it
+        fig, ax = plt.subplots()
 
-        plt.hist2d(x, y, (50, 50), cmap=plt.cm.jet)
+        ax.set_xlabel("BI")
+        ax.set_ylabel("SI")
+
+        hist = ax.imshow(
+            histogram_BI_SI(x, y, 50).T,
+            origin="lower",
+            extent=(*BI_SI_RANGE[0], *BI_SI_RANGE[1]),
+            aspect="auto",
+            cmap=plt.cm.jet,
+        )
 
-        x_step = [0, 0.1, 0.35, 0.7, 0.8, 1]
-        y_step = [1, 0.6, 0.35, 0.15, 0.1, 0]
-        plt.plot(x_step, y_step, "w")
+        ax.plot(X_STEP, Y_STEP, "w")
 
-        cb = plt.colorbar()
+        fig.colorbar(hist, ax=ax)
 
         if save:
-            plt.savefig(self.name + "_decision_boundary", dpi=100)
-            # TODO fix
-            # one of these works
-            cb.remove()
-            plt.close()
-            plt.close("all")
-            plt.clf()
-            plt.cla()
+            fig.savefig(self.name + "_decision_boundary", dpi=100)
+            plt.close(fig)
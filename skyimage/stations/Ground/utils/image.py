@@ -1,3 +1,7 @@
+from functools import lru_cache
+import threading
+from typing import Tuple
+
 import numpy as np
 
 
@@ -7,6 +11,101 @@ pixel processing utilities for GroundImage class
 
 """
 
+# BI / SI cloud decision boundary
+X_STEP: np.ndarray = np.array([0, 0.1, 0.35, 0.7, 0.8, 1], dtype=np.float32)
+Y_STEP: np.ndarray = np.array([1, 0.6, 0.35, 0.15, 0.1, 0], dtype=np.float32)
+BOUNDARY: np.ndarray = np.column_stack((X_STEP, Y_STEP))
+X_STEP.setflags(write=False)
+Y_STEP.setflags(write=False)
+BOUNDARY.setflags(write=False)
+
+# fixed BI / SI value ranges, spares histogram2d a min / max pass
+BI_SI_RANGE: Tuple[Tuple[float, float], Tuple[float, float]] = ((0, 1), (-1, 1))
+
+
+# images are extracted concurrently, first callers must not all load the mask
+_mask_lock = threading.RLock()
+
+
+def open_mask(mask_path: str) -> np.ndarray:
+    """Load crop mask at `mask_path`
+
+    The mask is static, so it is read from disk once and
+    the same read-only array is shared between images
+
+    Parameters
+    ----------
+    mask_path : str
+        path to np.ndarray defining crop mask
+
+    Returns
+    ----------
+    numpy.ndarray
+        read-only boolean crop mask
+
+    """
+    with _mask_lock:
+        return _load_mask(mask_path)
+
+
+# a few masks stay cached for runs mixing masks
+@lru_cache(maxsize=4)
+def _load_mask(mask_path: str) -> np.ndarray:
+    crop_mask: np.ndarray = np.load(mask_path).astype(bool)
+    crop_mask.setflags(write=False)
+
+    return crop_mask
+
+
+def calc_SI_BI(
+    img_arr: np.ndarray, crop_mask: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Calculate Sky Index and Brightness Index of masked `img_arr`
+
+    `SI = (B - R) / (B + R)` and `BI = (R + G + B) / 3` on 0-1
+    scaled bands. Band sums and differences are exact in 16-bit
+    integers, so each index takes a single float32 division and
+    no float RGB bands are materialized. `SI` is scale invariant,
+    so the 0-255 to 0-1 scaling is folded into the `BI` division
+
+    Parameters
+    ----------
+    img_arr : numpy.ndarray
+        RGB image with 0-255 values
+
+    crop_mask: numpy.ndarray
+        boolean crop mask, same shape as `img_arr`
+
+    Returns
+    ----------
+    Tuple[numpy.ndarray, numpy.ndarray]
+        float32 `SI` and `BI`, `nan` where a used band
+        is masked or zero
+
+    """
+    R: np.ndarray = img_arr[:, :, 0]
+    G: np.ndarray = img_arr[:, :, 1]
+    B: np.ndarray = img_arr[:, :, 2]
+
+    valid_R: np.ndarray = np.logical_and(crop_mask[:, :, 0], R)
+    valid_G: np.ndarray = np.logical_and(crop_mask[:, :, 1], G)
+    valid_B: np.ndarray = np.logical_and(crop_mask[:, :, 2], B)
+
+    valid_SI: np.ndarray = valid_R & valid_B
+    valid_BI: np.ndarray = valid_SI & valid_G
+
+    B_minus_R: np.ndarray = np.subtract(B, R, dtype=np.int16)
+    B_plus_R: np.ndarray = np.add(B, R, dtype=np.uint16)
+
+    SI = np.full(B.shape, np.nan, dtype=np.float32)
+    np.divide(B_minus_R, B_plus_R, out=SI, where=valid_SI, dtype=np.float32)
+
+    B_plus_R += G
+    BI = np.full(B.shape, np.nan, dtype=np.float32)
+    np.divide(B_plus_R, 3 * 255, out=BI, where=valid_BI, dtype=np.float32)
+
+    return SI, BI
+
 
 def f_above_or_below(p: np.ndarray, boundary: np.ndarray) -> int:
     """Determine if given point `p` is above
@@ -52,3 +151,84 @@ def f_above_or_below(p: np.ndarray, boundary: np.ndarray) -> int:
         return 0
     else:
         return 1
+
+
+def f_above_or_below_all(
+    BI: np.ndarray, SI: np.ndarray, boundary: np.ndarray
+) -> np.ndarray:
+    """Vectorized `f_above_or_below` over whole `BI` / `SI` arrays
+
+    Decision `boundary` must be sorted by ascending x with
+    strictly descending y
+
+    Parameters
+    ----------
+    BI : numpy.ndarray
+        Brightness Index values
+
+    SI : numpy.ndarray
+        Sky Index values, same shape as `BI`
+
+    boundary: numpy.ndarray
+        decision boundary line
+
+    Returns
+    ----------
+    numpy.ndarray
+        uint8 array shaped like `BI`, `1` where point is
+        above domain else (implied below) `0`
+
+    Raises
+    ----------
+    ValueError
+        If any point falls outside domain of decision `boundary`
+
+    """
+
+    if np.any((BI < boundary[0, 0]) | (BI > boundary[-1, 0])):
+        raise ValueError("`(BI, SI)` point falls outside `boundary` decision domain")
+
+    # index of first boundary vertex with y below SI
+    n_vertices: int = boundary.shape[0]
+    idx = n_vertices - np.searchsorted(boundary[::-1, 1], SI, side="left")
+    idx = np.minimum(idx, n_vertices - 1)
+
+    above = (SI > boundary[idx, 1]) & np.logical_not(BI < boundary[idx, 0])
+
+    # bool and uint8 share a layout, reinterpret without a copy
+    return above.view(np.uint8)
+
+
+def histogram_BI_SI(x: np.ndarray, y: np.ndarray, bins: int = 50) -> np.ndarray:
+    """Counts of paired BI / SI values on a `bins` x `bins` grid over `BI_SI_RANGE`
+
+    Uses `fast_histogram` when installed, uniform bins let it skip
+    `np.histogram2d`'s per-value bin search
+
+    Parameters
+    ----------
+    x : np.ndarray
+        BI values without NaNs
+
+    y : np.ndarray
+        SI values without NaNs
+
+    bins : int
+        bins per axis
+
+    Returns
+    ----------
+    numpy.ndarray
+        counts indexed [BI bin, SI bin]
+
+    """
+    try:
+        from fast_histogram import histogram2d
+    except ImportError:
+        counts, _, _ = np.histogram2d(x, y, bins, range=BI_SI_RANGE)
+        return counts
+
+    # fast_histogram drops values on the upper edge, numpy keeps them
+    hist_range = [(low, np.nextafter(high, np.inf)) for low, high in BI_SI_RANGE]
+
+    return histogram2d(x, y, bins, range=hist_range)
@@ -32,16 +32,3 @@ class STDDelta:
     @property
     def path(self):
         return self._path
-
-    def min_resolver(self, std: datetime, seconds: int, file_path: str):
-        """
-        Modifies object attributes if 'seconds' is
-        smaller than current object val
-        """
-
-        if seconds >= self._seconds:
-            return
-        else:
-            self._seconds = seconds
-            self._std = std
-            self._path = file_path
@@ -1,19 +1,23 @@
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+import os
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import TYPE_CHECKING
 from typing import Union
 
-import pandas as pd
 import rasterio as rio
-from rich.progress import track
 from skyimage.stations.Sky.SkyScene import SkyScene
 from skyimage.stations.Sky.utils.utils import SkyPlatform
+from skyimage.stations.Sky.utils.utils import index_scenes
 from skyimage.utils.utils import Station as StationObject
-from skyimage.utils.utils import buffer_value
 from skyimage.utils.validators import validate_datetime
 from skyimage.utils.validators import validate_file_path
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class SkyControl:
     """
@@ -91,10 +95,7 @@ class SkyControl:
             # turn j_day + year into datetime objects
             _, self.stds = validate_datetime(j_day, year)
 
-            stds_dict: dict = {}
-            for std in self.stds:
-                j_day = buffer_value(std.timetuple().tm_yday, 3)
-                stds_dict[str(std.year) + j_day] = std
+            stds_dict: dict = {f"{std:%Y%j}": std for std in self.stds}
 
             self.stds = stds_dict
 
@@ -127,11 +128,8 @@ class SkyControl:
 
     @property
     def j_days(self) -> List[str]:
-        j_days: list = []
-        for target in self.stds.values():
-            j_day = target.timetuple().tm_yday
-            j_days.append(buffer_value(j_day, 3))
-        return j_days
+        # stds keys are already year + padded julian day
+        return [key[-3:] for key in self.stds.keys()]
 
     @property
     def j_days_full(self) -> List[str]:
@@ -164,21 +162,33 @@ class SkyControl:
         `matching_scenes` : Dict[str, `SkyScene`]
 
         """
+        # one directory scan per year instead of a glob per day
+        scene_indexes: Dict[int, Dict[str, List[str]]] = {}
+
         matching_scenes: dict = {}
         for k, std in self.stds.items():
 
+            if std.year not in scene_indexes:
+                scene_indexes[std.year] = index_scenes(
+                    f"{self.path}/{std.year}", self.file_format
+                )
+
             scn_obj = SkyScene(
                 sky_path=self.path,
                 station=self.station,
                 target_time=std,
                 file_format=self.file_format,
+                scene_index=scene_indexes[std.year],
+                target_platform=self.platform,
             )
 
             matching_scenes[k] = scn_obj
 
         return matching_scenes
 
-    def run_all(self, show_time: bool = False) -> None:
+    def run_all(
+        self, show_time: bool = False, n_workers: Optional[int] = None
+    ) -> None:
         """Run all found SkyScene objects
 
         Parameters
@@ -186,21 +196,41 @@ class SkyControl:
         show_time : bool
             show time statistics
 
+        n_workers : int, optional
+            number of scenes processed at once, defaults to cpu count,
+            1 runs serially for debugging
+
         """
-        start = datetime.now()
-        for sky_obj in track(self.scenes.values(), description="Sky Scenes"):
+        from rich.progress import track
 
-            if not isinstance(sky_obj, SkyScene):
-                raise ValueError("Iterable must be type `SkyScene`")
+        start = datetime.now()
 
+        # `self.scenes` only ever holds `SkyScene` objects
+        def run_scene_object(sky_obj: SkyScene) -> None:
             sky_obj.run_all(show_time=show_time)
 
+        if not n_workers:
+            n_workers = os.cpu_count() or 1
+
+        if n_workers == 1:
+            for sky_obj in track(self.scenes.values(), description="Sky Scenes"):
+                run_scene_object(sky_obj)
+        else:
+            # scenes are independent and GDAL releases the GIL while reading,
+            # each scene opens its own datasets so none are shared across threads
+            with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                completed = executor.map(run_scene_object, self.scenes.values())
+                for _ in track(
+                    completed, total=len(self.scenes), description="Sky Scenes"
+                ):
+                    pass
+
         if show_time:
             print("SkyScene Done-", datetime.now() - start)
 
     def results(
         self, as_dataframe: Optional[bool] = False
-    ) -> Union[dict, pd.DataFrame]:
+    ) -> Union[dict, "pd.DataFrame"]:
         """Get processed results from all SkyScene objects
 
         Parameters
@@ -214,21 +244,19 @@ class SkyControl:
             all results as Dict
 
         """
-        all_results: dict = {}
+        names: list = []
+        records: list = []
 
         for sky_obj in self.scenes.values():
-
-            if not isinstance(sky_obj, SkyScene):
-                raise ValueError("Iterable must be type `SkyScene`")
-
-            name: str = sky_obj.j_day_full
-            results: dict = sky_obj.results()
-            all_results[name] = results
+            names.append(sky_obj.j_day_full)
+            records.append(sky_obj.results())
 
         if as_dataframe:
-            return pd.DataFrame.from_dict(all_results, orient="index")
+            import pandas as pd
+
+            return pd.DataFrame.from_records(records, index=names)
 
-        return all_results
+        return dict(zip(names, records))
 
     def extract_stds(self) -> dict:
         """Get matched `datetime`s from all
@@ -265,6 +293,8 @@ class SkyControl:
             Dictionary of metadata.
 
         """
-        with rio.open(target) as ds:
-            meta = ds.meta
+        # metadata only, skip the shared dataset registry and sidecar probing
+        with rio.Env(GDAL_DISABLE_READDIR_ON_OPEN="EMPTY_DIR"):
+            with rio.open(target, sharing=False) as ds:
+                meta = ds.meta
         return meta
@@ -1,21 +1,22 @@
 from datetime import datetime
-import glob
 import logging
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import TYPE_CHECKING
 from typing import Union
 import warnings
 
-import pandas as pd
+import numpy as np
+from numpy import ndarray
 import rasterio as rio
-from scipy import stats
 from skyimage.stations.Ground import GroundImage
 from skyimage.stations.Sky.utils.utils import SkyPlatform
-from skyimage.stations.Sky.utils.utils import binary_to_decimal
-from skyimage.stations.Sky.utils.utils import decimal_to_binary
+from skyimage.stations.Sky.utils.utils import index_scenes
 from skyimage.utils.utils import Station as StationObject
-from skyimage.utils.utils import buffer_value
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class SkyScene:
@@ -26,6 +27,8 @@ class SkyScene:
         station: Union[StationObject, str] = None,
         sky_path: str = None,
         file_format: str = "hdf",
+        scene_index: Optional[Dict[str, List[str]]] = None,
+        target_platform: Union[SkyPlatform, str] = "MODIS",
     ):
 
         self.target_time: datetime = target_time
@@ -46,7 +49,7 @@ class SkyScene:
             assert sky_path, "`sky_path` required when not using `direct_path`"
             assert target_time, "`target_time` required when not using `direct_path`"
 
-            self.__find_matching_scene(target_time, sky_path)
+            self.__find_matching_scene(target_time, sky_path, scene_index)
 
         if isinstance(station, StationObject):
             self.station = station
@@ -55,7 +58,14 @@ class SkyScene:
         else:
             raise ValueError("`station` must be a str or type Station")
 
-        self.target_sublayers: List[str] = SkyPlatform(platform="MODIS")
+        # shared platform objects are reused rather than rebuilt per scene
+        if isinstance(target_platform, SkyPlatform):
+            self.target_sublayers = target_platform
+        elif isinstance(target_platform, str):
+            self.target_sublayers = SkyPlatform(platform=target_platform)
+        else:
+            raise ValueError("`target_platform` must be a str or type `SkyPlatform`")
+
         self.processed: bool = False
 
         self.sub_layers: list
@@ -65,14 +75,11 @@ class SkyScene:
 
     @property
     def j_day(self) -> str:
-        j_day: int = self.target_time.timetuple().tm_yday
-        return buffer_value(j_day, 3)
+        return f"{self.target_time:%j}"
 
     @property
     def j_day_full(self) -> str:
-        j_day: int = self.target_time.timetuple().tm_yday
-        year: int = self.target_time.year
-        return str(year) + buffer_value(j_day, 3)
+        return f"{self.target_time:%Y%j}"
 
     @property
     def name(self) -> str:
@@ -102,7 +109,12 @@ class SkyScene:
                 return True
         return False
 
-    def __find_matching_scene(self, target_time: datetime, path: str) -> None:
+    def __find_matching_scene(
+        self,
+        target_time: datetime,
+        path: str,
+        scene_index: Optional[Dict[str, List[str]]] = None,
+    ) -> None:
         """Find path to desired scene
 
         Uses
@@ -120,28 +132,28 @@ class SkyScene:
         `path` : str
             Path for image search
 
+        `scene_index` : Dict[str, List[str]], optional
+            prebuilt `index_scenes` of the `target_time` year directory
+
         Defines
         ----------
         `self.direct_path`
             path to target scene
 
         """
-        year: str = str(target_time.year)
-        j_day: str = self.j_day
-        file_format = self.file_format
+        if scene_index is None:
+            scene_index = index_scenes(f"{path}/{target_time.year}", self.file_format)
 
-        matching_file_list = list(
-            glob.iglob(path + f"/{year}/*A{year + j_day}*.{file_format}")
-        )
+        matching_files: List[str] = scene_index.get(self.j_day_full, [])
 
-        if not matching_file_list:
+        if not matching_files:
             raise FileNotFoundError(f"Ground scene {str(target_time)} not found")
-        elif len(matching_file_list) > 1:
+        elif len(matching_files) > 1:
             raise LookupError(f"Multiple matching files found for {str(target_time)}")
         else:
-            logging.info(f"Ground scene {str(target_time)} found")
+            logging.info("Ground scene %s found", target_time)
 
-        self.direct_path = matching_file_list[0]
+        self.direct_path = matching_files[0]
 
     def run_all(
         self,
@@ -157,8 +169,14 @@ class SkyScene:
         """
 
         start_time: datetime = datetime.now()
-        self.extract_sublayers()
-        self.extract()
+
+        # one GDAL environment for all of the scene's dataset opens,
+        # instead of each `rio.open` setting up and tearing down its own,
+        # scenes have no sidecar files so skip listing their directory per open
+        with rio.Env(GDAL_DISABLE_READDIR_ON_OPEN="EMPTY_DIR"):
+            self.extract_sublayers()
+            self.extract()
+
         self.process()
 
         if show_time:
@@ -183,21 +201,30 @@ class SkyScene:
 
         """
         found_layers: dict = {}
+        abbreviations: Dict[str, str] = self.target_sublayers.abbreviations
 
         with rio.open(self.direct_path) as ds:
-            for name in ds.subdatasets:
-                for target in self.target_sublayers.layers:
-                    if target in name:
-                        logging.info(f"{target} layer found")
-                        abbrev = SkyPlatform.make_abbreviation(target)
+            # the last matching subdataset wins, so walk backwards
+            # and stop once every target has a match
+            for name in reversed(ds.subdatasets):
+                for target, abbrev in abbreviations.items():
+                    if abbrev not in found_layers and target in name:
+                        logging.info("%s layer found", target)
                         found_layers[abbrev] = name
 
-        for target in self.target_sublayers.layers:
-            abbrev = SkyPlatform.make_abbreviation(target)
-            if abbrev not in found_layers.keys():
-                raise FileNotFoundError(
-                    f"Could not find {target} in sublayers. Check {self.direct_path}"
-                )
+                if len(found_layers) == len(abbreviations):
+                    break
+
+        missing: List[str] = [
+            target
+            for target, abbrev in abbreviations.items()
+            if abbrev not in found_layers
+        ]
+        if missing:
+            raise FileNotFoundError(
+                f"Could not find {', '.join(missing)} in sublayers. "
+                f"Check {self.direct_path}"
+            )
         self.sub_layers = found_layers
 
     def extract(self) -> None:
@@ -223,19 +250,25 @@ class SkyScene:
         lat = self.station.latitude
         lon = self.station.longitude
         poi_dict = {}
+        window: Optional[rio.windows.Window] = None
 
         for key, val in self.sub_layers.items():
             with rio.open(val) as ds:
 
-                self.crs = ds.read_crs()
-                py, px = ds.index(lon, lat)
-                # WINDOW ADJUST
-                # first is 3x3, next is 2X2, next 1
-                # window = rio.windows.Window(px - 1, py - 1, 3, 3)
-                window = rio.windows.Window(px, py - 1, 2, 2)
-                # window = rio.windows.Window(px, py, 1, 1)
+                # sublayers of a scene share one grid and CRS,
+                # locate the window from the first only
+                if window is None:
+                    self.crs = ds.read_crs()
+                    py, px = ds.index(lon, lat)
+                    # WINDOW ADJUST
+                    # first is 3x3, next is 2X2, next 1
+                    # window = rio.windows.Window(px - 1, py - 1, 3, 3)
+                    window = rio.windows.Window(px, py - 1, 2, 2)
+                    # window = rio.windows.Window(px, py, 1, 1)
+
                 arr = ds.read(1, window=window)
-                logging.info(f"{key}\n{window}\n{arr}")
+                # lazy %-formatting, arrays are only printed when INFO is enabled
+                logging.info("%s\n%s\n%s", key, window, arr)
                 poi_dict[key] = arr
 
         self.raw_data: dict = poi_dict
@@ -272,33 +305,28 @@ class SkyScene:
                     Check {sub_layer} sublayer"
                 )
 
-        time_mode, _ = stats.mode(self.raw_data["CRGT"])
-        time_mode: str = str(time_mode[0][0])
+        # most common granule time in the window, ties go to the smaller
+        granule_times, counts = np.unique(self.raw_data["CRGT"], return_counts=True)
+        time_mode: str = str(granule_times[counts.argmax()])
 
         processed_dict["time_utc"] = time_mode
         self.actual_datetime = self.target_time.replace(
             hour=int(time_mode[0:2]), minute=int(time_mode[2:])
         )
 
-        avg_pixel_total = self.raw_data["NPA"].sum()
+        avg_pixel_total = int(self.raw_data["NPA"].sum(dtype=np.int64))
         processed_dict["n_TOTAL"] = avg_pixel_total
 
-        crnm = self.raw_data["CRNM"].flatten()
+        crnm: ndarray = self.raw_data["CRNM"].astype(np.uint32, copy=False).ravel()
 
-        for pixel in crnm:
+        for k, (start_bit, end_bit) in self.target_sublayers.bit_slices.items():
 
-            binary: str = decimal_to_binary(str(pixel))
+            bit_mask: int = (1 << (end_bit - start_bit + 1)) - 1
 
-            for k, v in num_mappings.items():
+            # bits `start_bit` through `end_bit` of every pixel
+            mapped_decimals: ndarray = (crnm >> start_bit) & bit_mask
 
-                start_bit, end_bit = [int(x) for x in v.split("-")]
-                end_i = len(binary) - start_bit
-                start_i = end_i - (end_bit - start_bit) - 1
-
-                mapped_octet: str = binary[start_i:end_i:1]
-                mapped_decimal: int = binary_to_decimal(mapped_octet)
-
-                processed_dict[k] = mapped_decimal + processed_dict.get(k, 0)
+            processed_dict[k] = int(mapped_decimals.sum(dtype=np.int64))
 
         for k, v in num_mappings.items():
 
@@ -310,12 +338,14 @@ class SkyScene:
         self.processed: bool = True
         self.data: dict = processed_dict
 
-    def results(self, as_dataframe: bool = False) -> Union[dict, pd.DataFrame]:
+    def results(self, as_dataframe: bool = False) -> Union[dict, "pd.DataFrame"]:
 
         if not self.processed:
             raise AssertionError("Object not processed")
 
         if as_dataframe:
+            import pandas as pd
+
             return pd.DataFrame.from_dict(self.data, orient="index")
 
         return self.data
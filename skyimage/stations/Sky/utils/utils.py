@@ -1,58 +1,55 @@
+from functools import lru_cache
+import os
+import re
+from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Tuple
 from typing import Union
 
 from skyimage.stations.Sky.ScenePlatforms import MODIS
 
 
-def decimal_to_binary(decimal: Union[int, str]) -> str:
-    """Convert decimal to binary 32-bit
+# acquisition date token in scene file names, A + year + julian day
+SCENE_DATE_PATTERN = re.compile(r"A(\d{7})")
 
-    Parameters
-    ----------
-    decimal : int or str
-        Decimal form.
-
-    Returns
-    ----------
-    str
-        Binary form.
-
-    Examples
-    ----------
-    >>> __decimal_to_binary(59)
-    111011
-    >>> __decimal_to_binary("462")
-    111001110
-    """
-    if type(decimal) is str:
-        decimal = int(decimal)
-
-    binary = str(bin(decimal))[2:]
-    return f"{int(binary):032}"
 
+def index_scenes(directory: str, file_format: str) -> Dict[str, List[str]]:
+    """Index scenes in `directory` by acquisition date
 
-def binary_to_decimal(binary: str) -> int:
-    """Convert binary to decimal
+    One directory scan serves lookups for every day
+    in `directory` instead of a glob per day
 
     Parameters
     ----------
-    binary : str
-        Binary form.
+    directory : str
+        directory of scenes
+
+    file_format : str
+        file format of scenes
 
     Returns
     ----------
-    int
-        Decimal form.
+    Dict[str, List[str]]
+        scene paths keyed by year + julian day
 
-    Examples
-    ----------
-    >>> __binary_to_decimal(111001110)
-    462
-    >>> __decimal_to_binary(110001)
-    49
     """
-    return int(binary, 2)
+    extension: str = f".{file_format}"
+    scene_index: Dict[str, List[str]] = {}
+
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                # glob skipped dotfiles (e.g. AppleDouble `._` files)
+                if entry.name.startswith(".") or not entry.name.endswith(extension):
+                    continue
+
+                for date in set(SCENE_DATE_PATTERN.findall(entry.name)):
+                    scene_index.setdefault(date, []).append(entry.path)
+    except FileNotFoundError:
+        pass
+
+    return scene_index
 
 
 class SkyPlatform:
@@ -61,6 +58,8 @@ class SkyPlatform:
     ):
 
         self.possible_platforms = {"MODIS": MODIS}
+        self._abbreviations: Optional[Dict[str, str]] = None
+        self._bit_slices: Optional[Dict[str, Tuple[int, int]]] = None
 
         if not override_layers:
             if platform not in self.possible_platforms:
@@ -105,11 +104,32 @@ class SkyPlatform:
     def num_map(self) -> List[str]:
         return self.platform.NUM_MAPPINGS
 
+    @property
+    def bit_slices(self) -> Dict[str, Tuple[int, int]]:
+        # `num_map` "start-end" ranges as inclusive ints, parsed once
+        if self._bit_slices is None:
+            self._bit_slices = {
+                name: tuple(int(bit) for bit in bits.split("-"))
+                for name, bits in self.num_map.items()
+            }
+        return self._bit_slices
+
+    @property
+    def abbreviations(self) -> Dict[str, str]:
+        # layers are fixed per platform, abbreviate them once
+        if self._abbreviations is None:
+            self._abbreviations = {
+                layer: self.make_abbreviation(layer) for layer in self.layers
+            }
+        return self._abbreviations
+
     @staticmethod
+    @lru_cache(maxsize=None)
     def make_abbreviation(target: str) -> str:
         """Make abbreviation of str
 
-        Join first letter of each word
+        Join first letter of each word, layer names are a
+        small fixed set so results are memoized
 
         """
         return "".join([word[0] for word in target.split()]).upper()
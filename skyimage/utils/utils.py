@@ -1,5 +1,8 @@
+from functools import lru_cache
 import json
+from types import MappingProxyType
 from typing import List
+from typing import Mapping
 from typing import Optional
 from typing import Union
 import warnings
@@ -22,6 +25,21 @@ def buffer_value(value: Union[str, int], buffer_length: int) -> str:
         raise TypeError("Value must be int or string")
 
 
+@lru_cache(maxsize=None)
+def _load_stations(path: str) -> Mapping[str, Mapping[str, float]]:
+    """Parsed station JSON at `path`, read once per path and shared
+
+    Read-only views, so callers cannot corrupt the cached stations
+
+    """
+    with open(path) as f:
+        stations: dict = json.load(f)
+
+    return MappingProxyType(
+        {name: MappingProxyType(position) for name, position in stations.items()}
+    )
+
+
 class Station:
     """
     Station object
@@ -76,8 +94,7 @@ class Station:
 
     def __find_coords(self) -> List[float]:
 
-        with open(self.path) as f:
-            valid_positions = json.load(f)
+        valid_positions: Mapping = _load_stations(self.path)
 
         if self.name in valid_positions:
             target_station = valid_positions[self.name]
@@ -54,12 +54,16 @@ def validate_datetime(j_day: str or int or list, year: int) -> List[str] and lis
     else:
         raise TypeError(f"Julian day is {type(j_day)} must be string or int")
 
+    # julian day N is N - 1 days after January 1st, no strptime needed
+    new_year: datetime.datetime = datetime.datetime(int(year), 1, 1)
+
     for day in processed_j_day:
         if not validate_j_day(day):
             raise ValueError("Julian value is out of 0 - 365 range")
+        if int(day) == 0:
+            # strptime rejected day 0, keep it an error rather than Dec 31st
+            raise ValueError("Julian day 0 does not exist, days start at 1")
         valid_j_days.append(f"{int(day):03}")
-
-    for day in valid_j_days:
-        valid_stds.append(datetime.datetime.strptime(str(year) + str(day), "%Y%j"))
+        valid_stds.append(new_year + datetime.timedelta(days=int(day) - 1))
 
     return valid_j_days, valid_stds